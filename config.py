@@ -9,6 +9,24 @@ Configuration values can be overridden by environment variables where appropriat
 """
 
 import os
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional
+
+from utils.dataclass_utils import DATACLASS_SLOTS
+
+# Environment snapshot
+# Configuration values never change after startup, so the process environment is
+# copied once here and every lookup below reads from this dict instead of
+# rescanning os.environ. Reloading this module (as tests do) takes a fresh snapshot.
+_ENV = dict(os.environ)
+
+
+def _env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Return an environment value from the import-time snapshot."""
+    return _ENV.get(key, default)
+
 
 # Version and metadata
 # These values are used in server responses and for tracking releases
@@ -25,10 +43,14 @@ __author__ = "Fahad Gilani"
 # This should be a stable, high-performance model suitable for code analysis
 # Can be overridden by setting DEFAULT_MODEL environment variable
 # Special value "auto" means Claude should pick the best model for each task
-DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "auto")
+DEFAULT_MODEL = sys.intern(_env("DEFAULT_MODEL", "auto"))
 
 # Auto mode detection - when DEFAULT_MODEL is "auto", Claude picks the model
+# Any casing of "auto" is canonicalized once here so later checks compare against
+# the interned literal; concrete model names keep their original spelling.
 IS_AUTO_MODE = DEFAULT_MODEL.lower() == "auto"
+if IS_AUTO_MODE:
+    DEFAULT_MODEL = sys.intern("auto")
 
 # Each provider (gemini.py, openai_provider.py, xai.py) defines its own SUPPORTED_MODELS
 # with detailed descriptions. Tools use ModelProviderRegistry.get_available_model_names()
@@ -61,7 +83,7 @@ TEMPERATURE_CREATIVE = 0.7  # For architecture, deep thinking
 # Thinking Mode Defaults
 # DEFAULT_THINKING_MODE_THINKDEEP: Default thinking depth for extended reasoning tool
 # Higher modes use more computational budget but provide deeper analysis
-DEFAULT_THINKING_MODE_THINKDEEP = os.getenv("DEFAULT_THINKING_MODE_THINKDEEP", "high")
+DEFAULT_THINKING_MODE_THINKDEEP = _env("DEFAULT_THINKING_MODE_THINKDEEP", "high")
 
 # Consensus Tool Defaults
 # Consensus timeout and rate limiting settings
@@ -71,48 +93,114 @@ DEFAULT_CONSENSUS_MAX_INSTANCES_PER_COMBINATION = 2
 # NOTE: Consensus tool now uses sequential processing for MCP compatibility
 # Concurrent processing was removed to avoid async pattern violations
 
+# Lazily built constants
+# MODEL_PREFERENCES, GPT5_CONFIG and GPT4_1_CONFIG are only read by the GPT-5
+# optimization paths, so they are built on first access through the module-level
+# __getattr__ below (PEP 562) and then cached as regular module attributes.
+
 # Model Preferences for GPT-5 & Opus 4.1 Optimizations
 # These preferences guide automatic model selection based on task type
-MODEL_PREFERENCES = {
-    "planning": ["gpt-4.1", "gpt-5"],  # GPT-4.1 for large context, GPT-5 for reasoning
-    "code_review": ["gpt-5", "gpt-4.1"],  # GPT-5 for deep analysis, GPT-4.1 for coverage
-    "debugging": ["gpt-5", "o3"],  # GPT-5 for reasoning, O3 as fallback
-    "refactoring": ["gpt-4.1", "gpt-5"],  # GPT-4.1 for entire codebase understanding
-    "architecture": ["gpt-5", "gpt-4.1"],  # Both excellent for architecture
-    "security_audit": ["gpt-5", "o3"],  # GPT-5 for comprehensive analysis
-    "testing": ["gpt-5", "gpt-5-mini"],  # GPT-5 for test generation
-    "documentation": ["gpt-5-mini", "gpt-5"],  # Mini for speed, full for quality
-    "chat": ["gpt-5-mini", "gpt-5-nano", "gpt-5"],  # Fast models for chat
-    "general": ["gpt-5", "gpt-4.1", "o3"],  # General fallback order
+# Exposed as a read-only mapping of tuples with interned model names, so callers
+# iterate shared immutable data and name comparisons are cheap
+_MODEL_PREFERENCES = {
+    "planning": ("gpt-4.1", "gpt-5"),  # GPT-4.1 for large context, GPT-5 for reasoning
+    "code_review": ("gpt-5", "gpt-4.1"),  # GPT-5 for deep analysis, GPT-4.1 for coverage
+    "debugging": ("gpt-5", "o3"),  # GPT-5 for reasoning, O3 as fallback
+    "refactoring": ("gpt-4.1", "gpt-5"),  # GPT-4.1 for entire codebase understanding
+    "architecture": ("gpt-5", "gpt-4.1"),  # Both excellent for architecture
+    "security_audit": ("gpt-5", "o3"),  # GPT-5 for comprehensive analysis
+    "testing": ("gpt-5", "gpt-5-mini"),  # GPT-5 for test generation
+    "documentation": ("gpt-5-mini", "gpt-5"),  # Mini for speed, full for quality
+    "chat": ("gpt-5-mini", "gpt-5-nano", "gpt-5"),  # Fast models for chat
+    "general": ("gpt-5", "gpt-4.1", "o3"),  # General fallback order
 }
 
-# GPT-5 Specific Configuration
-GPT5_CONFIG = {
-    "default_thinking_mode": os.getenv("GPT5_DEFAULT_THINKING_MODE", "medium"),
-    "max_reasoning_tokens": int(os.getenv("GPT5_MAX_REASONING_TOKENS", "12000")),
-    "escalation_enabled": os.getenv("GPT5_ESCALATION_ENABLED", "true").lower() == "true",
-    "file_strategy": os.getenv("GPT5_FILE_STRATEGY", "priority"),  # all, priority, summary
-    "conversation_strategy": os.getenv("GPT5_CONVERSATION_STRATEGY", "balanced"),  # full, balanced, summary
-}
 
-# GPT-4.1 (Opus) Specific Configuration  
-GPT4_1_CONFIG = {
-    "auto_continue": os.getenv("GPT4_1_AUTO_CONTINUE", "true").lower() == "true",
-    "max_output_tokens": int(os.getenv("GPT4_1_MAX_OUTPUT", "32000")),
-    "file_strategy": os.getenv("GPT4_1_FILE_STRATEGY", "all"),  # all, priority, summary
-    "conversation_strategy": os.getenv("GPT4_1_CONVERSATION_STRATEGY", "full"),  # full, balanced, summary
+def _build_model_preferences() -> MappingProxyType:
+    """Build the read-only MODEL_PREFERENCES mapping."""
+    return MappingProxyType(
+        {task: tuple(sys.intern(model) for model in models) for task, models in _MODEL_PREFERENCES.items()}
+    )
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class GPT5Config:
+    """GPT-5 specific configuration."""
+
+    default_thinking_mode: str
+    max_reasoning_tokens: int
+    escalation_enabled: bool
+    file_strategy: str  # all, priority, summary
+    conversation_strategy: str  # full, balanced, summary
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class GPT41Config:
+    """GPT-4.1 (Opus) specific configuration."""
+
+    auto_continue: bool
+    max_output_tokens: int
+    file_strategy: str  # all, priority, summary
+    conversation_strategy: str  # full, balanced, summary
+
+
+def _build_gpt5_config() -> GPT5Config:
+    """Build GPT-5 specific configuration."""
+    return GPT5Config(
+        default_thinking_mode=_env("GPT5_DEFAULT_THINKING_MODE", "medium"),
+        max_reasoning_tokens=int(_env("GPT5_MAX_REASONING_TOKENS", "12000")),
+        escalation_enabled=_env("GPT5_ESCALATION_ENABLED", "true").lower() == "true",
+        file_strategy=_env("GPT5_FILE_STRATEGY", "priority"),
+        conversation_strategy=_env("GPT5_CONVERSATION_STRATEGY", "balanced"),
+    )
+
+
+def _build_gpt4_1_config() -> GPT41Config:
+    """Build GPT-4.1 (Opus) specific configuration."""
+    return GPT41Config(
+        auto_continue=_env("GPT4_1_AUTO_CONTINUE", "true").lower() == "true",
+        max_output_tokens=int(_env("GPT4_1_MAX_OUTPUT", "32000")),
+        file_strategy=_env("GPT4_1_FILE_STRATEGY", "all"),
+        conversation_strategy=_env("GPT4_1_CONVERSATION_STRATEGY", "full"),
+    )
+
+
+_LAZY_CONSTANT_BUILDERS = {
+    "MODEL_PREFERENCES": _build_model_preferences,
+    "GPT5_CONFIG": _build_gpt5_config,
+    "GPT4_1_CONFIG": _build_gpt4_1_config,
 }
 
+# Drop values cached by a previous import so importlib.reload() rebuilds them
+for _name in _LAZY_CONSTANT_BUILDERS:
+    globals().pop(_name, None)
+
+
+def __getattr__(name: str):
+    """Build lazily defined constants on first access and cache them on the module."""
+    builder = _LAZY_CONSTANT_BUILDERS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+
+# ENABLE_GPT5: Whether GPT-5 specific optimizations are enabled
+ENABLE_GPT5 = _env("ENABLE_GPT5", "true").lower() == "true"
+
 # Token Budget Allocation (as percentages of available tokens)
-TOKEN_BUDGET_CONFIG = {
-    "system": float(os.getenv("TOKEN_BUDGET_SYSTEM", "0.02")),  # 2% for system prompts
-    "instructions": float(os.getenv("TOKEN_BUDGET_INSTRUCTIONS", "0.03")),  # 3% for instructions
-    "files": float(os.getenv("TOKEN_BUDGET_FILES", "0.60")),  # 60% for file content
-    "conversation": float(os.getenv("TOKEN_BUDGET_CONVERSATION", "0.27")),  # 27% for history
-    "buffer": float(os.getenv("TOKEN_BUDGET_BUFFER", "0.08")),  # 8% safety margin
-}
+TOKEN_BUDGET_CONFIG = MappingProxyType(
+    {
+        "system": float(_env("TOKEN_BUDGET_SYSTEM", "0.02")),  # 2% for system prompts
+        "instructions": float(_env("TOKEN_BUDGET_INSTRUCTIONS", "0.03")),  # 3% for instructions
+        "files": float(_env("TOKEN_BUDGET_FILES", "0.60")),  # 60% for file content
+        "conversation": float(_env("TOKEN_BUDGET_CONVERSATION", "0.27")),  # 27% for history
+        "buffer": float(_env("TOKEN_BUDGET_BUFFER", "0.08")),  # 8% safety margin
+    }
+)
 
 # Validate budget allocations
+# warnings is only imported when the allocations are actually over budget
 _budget_total = sum(TOKEN_BUDGET_CONFIG.values())
 if _budget_total > 1.0:
     import warnings
@@ -164,7 +252,7 @@ def _calculate_mcp_prompt_limit() -> int:
         Maximum character count for user input prompts
     """
     # Check for Claude's MAX_MCP_OUTPUT_TOKENS environment variable
-    max_tokens_str = os.getenv("MAX_MCP_OUTPUT_TOKENS")
+    max_tokens_str = _env("MAX_MCP_OUTPUT_TOKENS")
 
     if max_tokens_str:
         try:
@@ -183,6 +271,14 @@ def _calculate_mcp_prompt_limit() -> int:
 
 MCP_PROMPT_SIZE_LIMIT = _calculate_mcp_prompt_limit()
 
+# TOKEN_BUDGET_CHARS: Character caps per TOKEN_BUDGET_CONFIG category, resolved once
+# MCP_PROMPT_SIZE_LIMIT is the 60% input share in characters, so dividing by 0.6
+# recovers the full transport budget in characters before applying each share.
+_MCP_TOTAL_CHARS = MCP_PROMPT_SIZE_LIMIT / 0.6
+TOKEN_BUDGET_CHARS = MappingProxyType(
+    {category: int(_MCP_TOTAL_CHARS * share) for category, share in TOKEN_BUDGET_CONFIG.items()}
+)
+
 # Language/Locale Configuration
 # LOCALE: Language/locale specification for AI responses
 # When set, all AI tools will respond in the specified language while
@@ -190,7 +286,7 @@ MCP_PROMPT_SIZE_LIMIT = _calculate_mcp_prompt_limit()
 # Examples: "fr-FR", "en-US", "zh-CN", "zh-TW", "ja-JP", "ko-KR", "es-ES",
 # "de-DE", "it-IT", "pt-PT"
 # Leave empty for default language (English)
-LOCALE = os.getenv("LOCALE", "")
+LOCALE = _env("LOCALE", "")
 
 # Threading configuration
 # Simple in-memory conversation threading for stateless MCP environment
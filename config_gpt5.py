@@ -61,6 +61,12 @@ MODEL_PREFERENCES = {
 # MCP Protocol Limits (Claude Desktop specific)
 MCP_PROMPT_SIZE_LIMIT = 100_000  # Larger for GPT-5 workflows
 
+# Tool Call Cache
+# Identical calls to deterministic analysis tools within this window reuse the
+# previous result instead of calling GPT-5 again (0 disables the cache)
+TOOL_CALL_CACHE_TTL = float(os.getenv("TOOL_CALL_CACHE_TTL", "300"))
+TOOL_CALL_CACHE_MAX_ENTRIES = 256
+
 # Language/Locale 
 LOCALE = os.getenv("LOCALE", "")
 
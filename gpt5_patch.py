@@ -6,8 +6,32 @@ Fixes parameter differences between GPT-4 and GPT-5 API calls.
 GPT-5 uses max_completion_tokens instead of max_tokens.
 """
 
+import mmap
 import os
 import re
+from pathlib import Path
+
+# Patterns are compiled once at import rather than on every file
+# Pattern 1: Direct max_tokens parameter in a GPT-5 call
+_GPT5_MAX_TOKENS_KWARG = re.compile(r'(model=[\'"](gpt-5[^\'"]*)[\'"],[^}]*?)max_tokens=')
+# Pattern 2: max_tokens key in parameter dictionaries
+_MAX_TOKENS_KEY = re.compile(r'"max_tokens":(\s*\d+)')
+
+
+def _patch_content(content):
+    """Apply the GPT-5 parameter rewrites to a file's contents."""
+    content = _GPT5_MAX_TOKENS_KWARG.sub(r'\1max_completion_tokens=', content)
+    return _MAX_TOKENS_KEY.sub(r'"max_completion_tokens":\1', content)
+
+
+def _mentions_max_tokens(path):
+    """Check for a max_tokens occurrence without decoding the file."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False  # mmap cannot map empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(b"max_tokens") >= 0
+
 
 def patch_openai_files():
     """Patch OpenAI-related files to use GPT-5 parameters correctly."""
@@ -21,33 +45,23 @@ def patch_openai_files():
     print("🔧 Patching files for GPT-5 compatibility...")
     
     for file_path in files_to_patch:
-        if os.path.exists(file_path):
+        path = Path(file_path)
+        if path.exists():
             print(f"  Patching {file_path}...")
             
-            with open(file_path, 'r') as f:
-                content = f.read()
+            # Skip reading and decoding files that cannot match either pattern
+            if not _mentions_max_tokens(path):
+                print(f"    - No changes needed in {file_path}")
+                continue
             
             # Replace max_tokens with max_completion_tokens for GPT-5
             # But only in GPT-5 specific contexts
-            original_content = content
-            
-            # Pattern 1: Direct max_tokens parameter
-            content = re.sub(
-                r'(model=[\'"](gpt-5[^\'"]*)[\'"],[^}]*?)max_tokens=',
-                r'\1max_completion_tokens=',
-                content
-            )
-            
-            # Pattern 2: In parameter dictionaries
-            content = re.sub(
-                r'("max_tokens":\s*\d+)',
-                r'"max_completion_tokens": \1'.replace('"max_tokens": ', ''),
-                content
-            )
+            original_content = path.read_text()
+            content = _patch_content(original_content)
             
+            # Only rewrite files that actually changed
             if content != original_content:
-                with open(file_path, 'w') as f:
-                    f.write(content)
+                path.write_text(content)
                 print(f"    ✓ Patched {file_path}")
             else:
                 print(f"    - No changes needed in {file_path}")